@@ -7,29 +7,108 @@ and then downloads the generated Excel file.
 Usage: python scrape_esb.py --config config.yaml
 """
 import argparse
+import calendar
 import time
 import yaml
 import logging
 import os
+import queue
+import random
 import re
-from typing import Dict, Any, Optional, Generator
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
 from urllib.parse import urljoin
 
+import lxml.etree
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger("esb_scraper")
 
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+# Longest a single request may sleep honouring a Retry-After header
+MAX_RETRY_AFTER_SECONDS = 30
+
+# Queue IDs already claimed by a month. Shared across concurrent pollers so
+# two months never download the same queue entry.
+_claimed_queue_ids: Set[str] = set()
+_claimed_lock = threading.Lock()
+
+# Earliest time the next month may send its first request; enforces rate_limit_seconds
+# across all concurrent workers.
+_next_month_start = 0.0
+_rate_limit_lock = threading.Lock()
+
+# Precompiled patterns used on the polling and download paths.
+DOWNLOAD_HREF_RE = re.compile(r"/site/download-queue\?id=(\d+)")
+# Any "?id=N" link in a queue row (download, view or delete actions) carries its queue ID.
+QUEUE_ID_RE = re.compile(r"[?&;]id=(\d+)")
+FILENAME_RE = re.compile(r'filename="(.+?)"')
+QUEUE_ROW_RE = re.compile(r"<tr\b.*?</tr>", re.S | re.I)
+CSRF_RE = re.compile(r'<meta[^>]+name="csrf-token"[^>]+content="([^"]+)"', re.I)
+
 # --- Core Scraping Logic ---
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
+class CappedRetry(Retry):
+    """Retry that honours Retry-After headers but never sleeps longer than MAX_RETRY_AFTER_SECONDS."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER_SECONDS)
+
+def create_session(config: Dict[str, Any], concurrency: int) -> requests.Session:
+    """Creates a session whose connection pool and retry policy fit the given concurrency."""
+    session = requests.Session()
+    retries = CappedRetry(
+        total=3,
+        backoff_factor=1,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency * 2, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": config.get("user_agent", "ESB-Scraper/1.0"),
+        "Connection": "keep-alive",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    return session
+
+def clone_session(session: requests.Session) -> requests.Session:
+    """Creates a session with its own cookies, headers and cached CSRF token copied
+    from ``session``, sharing only its (thread-safe) connection pools.
+
+    Sessions themselves are not safe to use from several threads, so every worker
+    gets a clone of the logged-in session. Clones must not be closed, as that would
+    close the shared pools; they are released when the original session is closed.
+    """
+    clone = requests.Session()
+    clone.headers.update(session.headers)
+    clone.cookies.update(session.cookies)
+    for prefix, adapter in session.adapters.items():
+        clone.mount(prefix, adapter)
+    clone.csrf_token = getattr(session, "csrf_token", None)
+    return clone
+
 def fetch(session: requests.Session, url: str, method: str = "GET", **kwargs) -> requests.Response:
-    """Generic fetch function with retry logic."""
+    """Generic fetch function; retries are handled by the session's HTTPAdapter."""
     logger.debug(f"Requesting {method} {url}")
     if method.upper() == "GET":
         r = session.get(url, **kwargs)
@@ -38,10 +117,18 @@ def fetch(session: requests.Session, url: str, method: str = "GET", **kwargs) ->
     r.raise_for_status()
     return r
 
-def get_csrf_token(soup: BeautifulSoup) -> Optional[str]:
-    """Extracts CSRF token from a BeautifulSoup object."""
-    token_tag = soup.find("meta", {"name": "csrf-token"})
-    return token_tag["content"] if token_tag else None
+def get_csrf_token(html: str) -> Optional[str]:
+    """Extracts the CSRF token from the page's csrf-token meta tag."""
+    match = CSRF_RE.search(html)
+    if match:
+        return match.group(1)
+    # Fall back to a real parse in case the attributes are ordered differently.
+    try:
+        tokens = lxml.html.fromstring(html).xpath('//meta[@name="csrf-token"]/@content')
+    except (lxml.etree.ParserError, ValueError):
+        # Empty documents, or XHTML with an encoding declaration in a str
+        return None
+    return tokens[0] if tokens else None
 
 def login(session: requests.Session, config: Dict[str, Any]) -> bool:
     """Logs into the website and returns True on success."""
@@ -51,9 +138,7 @@ def login(session: requests.Session, config: Dict[str, Any]) -> bool:
     try:
         logger.info(f"Fetching login page at {login_url}")
         resp_get = fetch(session, login_url, timeout=15)
-        soup = BeautifulSoup(resp_get.text, "lxml")
-        
-        csrf_token = get_csrf_token(soup)
+        csrf_token = get_csrf_token(resp_get.text)
         if not csrf_token:
             logger.error("Could not find CSRF token on login page.")
             return False
@@ -73,42 +158,110 @@ def login(session: requests.Session, config: Dict[str, Any]) -> bool:
             return False
 
         logger.info("Login successful.")
-        return True
 
     except requests.exceptions.RequestException as e:
         logger.error(f"An error occurred during login: {e}")
         return False
 
-def generate_monthly_ranges(start_date_str: str, end_date_str: str) -> Generator[Dict[str, str], None, None]:
-    """Yields dictionaries with start and end dates for each month in the range."""
-    current_date = datetime.strptime(start_date_str, "%Y-%m-%d")
+    # The CSRF token is bound to the session cookie, so fetch it once and reuse it
+    # for every report request. A failure here is not fatal: request_report_generation
+    # fetches the token on demand.
+    try:
+        csrf_token = refresh_csrf_token(session, config)
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Could not fetch report page for CSRF token: {e}")
+        csrf_token = None
+    if not csrf_token:
+        logger.warning("Could not cache CSRF token after login; it will be fetched on demand.")
+    return True
+
+def generate_monthly_ranges(start_date_str: str, end_date_str: str) -> List[Dict[str, str]]:
+    """Returns dictionaries with start and end dates for each calendar month in the range."""
+    start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
     end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+    year, month, day = start_date.year, start_date.month, start_date.day
     
-    while current_date <= end_date:
-        start_of_month = current_date.strftime("%d-%m-%Y")
-        end_of_month_dt = current_date + relativedelta(months=1, days=-1)
-        if end_of_month_dt > end_date:
-            end_of_month_dt = end_date
-        end_of_month = end_of_month_dt.strftime("%d-%m-%Y")
+    # Dates are formatted with f-strings rather than strftime to keep the loop cheap.
+    ranges = []
+    while (year, month, day) <= (end_date.year, end_date.month, end_date.day):
+        last_day = calendar.monthrange(year, month)[1]
+        if (year, month) == (end_date.year, end_date.month):
+            last_day = end_date.day
         
-        yield {
-            "start": start_of_month,
-            "end": end_of_month,
-            "label": current_date.strftime("%Y-%m")
-        }
-        current_date += relativedelta(months=1)
+        ranges.append({
+            "start": f"{day:02d}-{month:02d}-{year}",
+            "end": f"{last_day:02d}-{month:02d}-{year}",
+            "label": f"{year}-{month:02d}"
+        })
+
+        day = 1
+        month += 1
+        if month == 13:
+            month = 1
+            year += 1
+    return ranges
+
+def refresh_csrf_token(session: requests.Session, config: Dict[str, Any]) -> Optional[str]:
+    """Fetches the report page and caches its CSRF token on the session."""
+    logger.info("Fetching report page for CSRF token")
+    resp = fetch(session, config["urls"]["report"], timeout=15)
+    session.csrf_token = get_csrf_token(resp.text)
+    return session.csrf_token
+
+def parse_queue_row(row_html: str) -> Tuple[Optional[str], Optional[str]]:
+    """Returns a queue row's ID and, once the report is completed, its download path."""
+    download_match = DOWNLOAD_HREF_RE.search(row_html)
+    if download_match and "Completed" in row_html:
+        return download_match.group(1), download_match.group(0)
+    queue_id_match = QUEUE_ID_RE.search(row_html)
+    return (queue_id_match.group(1) if queue_id_match else None), None
+
+def parse_generation_response(html: str, date_range_label: str) -> Tuple[Optional[str], Set[str]]:
+    """Reads the queue rows for a label from the page returned after requesting a report.
 
-def request_report_generation(session: requests.Session, config: Dict[str, Any], date_range: Dict[str, str]) -> bool:
-    """Sends a POST request to trigger the server-side report generation."""
+    Returns the ID of the newest unfinished report (the one just requested) and the IDs
+    of every other report for the label, which existed before the request.
+    """
+    pending_ids = []
+    seen_ids = set()
+    for row in QUEUE_ROW_RE.findall(html):
+        if date_range_label not in row:
+            continue
+        queue_id, download_path = parse_queue_row(row)
+        if not queue_id:
+            continue
+        if download_path:
+            seen_ids.add(queue_id)
+        else:
+            pending_ids.append(queue_id)
+    if not pending_ids:
+        return None, seen_ids
+    expected_id = max(pending_ids, key=int)
+    seen_ids.update(queue_id for queue_id in pending_ids if queue_id != expected_id)
+    return expected_id, seen_ids
+
+def _claim_queue_id(queue_id: str) -> bool:
+    """Marks a queue ID as taken; returns False if another month already claimed it."""
+    with _claimed_lock:
+        if queue_id in _claimed_queue_ids:
+            return False
+        _claimed_queue_ids.add(queue_id)
+        return True
+
+def request_report_generation(session: requests.Session, config: Dict[str, Any],
+                              date_range: Dict[str, str]) -> Tuple[bool, Optional[str], Set[str]]:
+    """Sends a POST request to trigger the server-side report generation.
+
+    Returns whether the request was accepted, plus what the response reveals about the
+    queue (see parse_generation_response): the new report's ID, if listed, and the IDs
+    of older reports for the same month.
+    """
     report_url = config["urls"]["report"]
     try:
-        logger.info(f"Fetching report page for CSRF token for {date_range['label']}")
-        resp_get = fetch(session, report_url, timeout=15)
-        soup = BeautifulSoup(resp_get.text, "lxml")
-        csrf_token = get_csrf_token(soup)
+        csrf_token = getattr(session, "csrf_token", None) or refresh_csrf_token(session, config)
         if not csrf_token:
             logger.error("Could not find CSRF token on report page.")
-            return False
+            return False, None, set()
 
         form_data = {
             "_csrf-esb-fnb-backend": csrf_token,
@@ -121,78 +274,150 @@ def request_report_generation(session: requests.Session, config: Dict[str, Any],
         }
 
         logger.info(f"Requesting report generation for {date_range['label']}...")
-        fetch(session, report_url, method="POST", data=form_data, timeout=30)
+        try:
+            resp = fetch(session, report_url, method="POST", data=form_data, timeout=30)
+        except requests.exceptions.HTTPError as e:
+            # Yii rejects a stale CSRF token with 400/403; refresh it once and retry.
+            if e.response is None or e.response.status_code not in (400, 403):
+                raise
+            logger.warning(f"CSRF token rejected ({e.response.status_code}), refreshing and retrying...")
+            csrf_token = refresh_csrf_token(session, config)
+            if not csrf_token:
+                logger.error("Could not find CSRF token on report page.")
+                return False, None, set()
+            form_data["_csrf-esb-fnb-backend"] = csrf_token
+            resp = fetch(session, report_url, method="POST", data=form_data, timeout=30)
         logger.info("Report generation request sent successfully.")
-        return True
+
+        queue_id, seen_ids = parse_generation_response(resp.text, date_range["label"])
+        if queue_id:
+            logger.info(f"Report for {date_range['label']} is queued with ID {queue_id}")
+        return True, queue_id, seen_ids
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to request report generation for {date_range['label']}: {e}")
-        return False
+        return False, None, set()
+
+def poll_report_queue(session: requests.Session, config: Dict[str, Any], date_range_label: str,
+                      expected_id: Optional[str] = None, seen_ids: Iterable[str] = ()) -> Optional[str]:
+    """Polls the report queue and returns the download URL when the report is ready.
 
-def poll_report_queue(session: requests.Session, config: Dict[str, Any], date_range_label: str) -> Optional[str]:
-    """Polls the report queue and returns the download URL when the report is ready."""
+    If ``expected_id`` is given, that report is used once it completes. If it is not
+    in the queue (or not given), the first unclaimed completed report whose name
+    contains the label is used instead. Reports in ``seen_ids`` existed before the
+    request and are never picked.
+    """
     queue_url = urljoin(config["urls"]["login"], "/site/get-data-report-queue")
     polling_config = config["polling_settings"]
     timeout = time.time() + polling_config["timeout_seconds"]
     
     logger.info(f"Polling report queue for a report matching '{date_range_label}'...")
     
-    processed_ids = set()
+    processed_ids = set(seen_ids)
+    # Start polling quickly and slow down geometrically, so fast reports are picked up
+    # almost immediately while slow ones don't hammer the queue.
+    interval = polling_config.get("min_interval_seconds", 1.0)
+    max_interval = polling_config.get("max_interval_seconds", 15.0)
+    growth_factor = polling_config.get("growth_factor", 1.5)
+    jitter = polling_config.get("jitter_seconds", 0.5)
+    # Errors back off towards their own, larger ceiling so a failing server is never
+    # polled more often than a healthy one.
+    max_backoff = polling_config.get("max_backoff_seconds", 120.0)
+    # Space polls start-to-start rather than end-to-start, hiding the request round trip.
+    pipeline = polling_config.get("pipeline", False)
+    consecutive_errors = 0
+    conditional_headers: Dict[str, str] = {}
 
     while time.time() < timeout:
+        poll_started = time.monotonic()
         try:
-            resp = fetch(session, queue_url, timeout=10)
-            queue_data = resp.json()
-            logger.debug(f"Received queue data: {queue_data}")
+            resp = fetch(session, queue_url, headers=conditional_headers, timeout=10)
+            if resp.status_code == 304:
+                logger.debug("Report queue unchanged since last poll.")
+            else:
+                queue_data = resp.json()
+                # Remember validators so unchanged queues come back as an empty 304. Only
+                # done after a successful parse, or a bad body would never be re-fetched.
+                conditional_headers.clear()
+                if resp.headers.get("ETag"):
+                    conditional_headers["If-None-Match"] = resp.headers["ETag"]
+                if resp.headers.get("Last-Modified"):
+                    conditional_headers["If-Modified-Since"] = resp.headers["Last-Modified"]
+                logger.debug(f"Received queue data: {queue_data}")
             
-            # The queue data is a list of reports. We need to find the newest completed one.
-            # The most reliable way is to find a completed report that we haven't processed yet.
+                # The queue data is a list of reports. We need to find the newest completed one.
+                # The most reliable way is to find a completed report that we haven't processed yet.
             
-            for item in queue_data.get("data", []):
-                item_html_str = " ".join(item)
-                soup = BeautifulSoup(item_html_str, "lxml")
-
-                # Find the download link to get the ID
-                download_tag = soup.find("a", href=re.compile(r"/site/download-queue\?id=(\d+)"))
-                if not download_tag:
-                    continue
-
-                queue_id_match = re.search(r"id=(\d+)", download_tag["href"])
-                if not queue_id_match:
-                    continue
-                
-                queue_id = queue_id_match.group(1)
-
-                # Check if we've already seen this completed report
-                if queue_id in processed_ids:
-                    continue
-
-                # Check for completion status and if the name contains the month
-                if "Completed" in item_html_str and date_range_label in item_html_str:
-                    download_url = urljoin(config["urls"]["login"], download_tag["href"])
-                    logger.info(f"Found completed report for {date_range_label} (ID: {queue_id}). URL: {download_url}")
-                    return download_url
-                
-                # If it's completed but name doesn't match, just mark it as processed
-                if "Completed" in item_html_str:
+                # Checks are ordered by selectivity: most rows are not completed, so skip
+                # those before joining the row or running the regex or the label scan.
+                rows = queue_data.get("data", [])
+                label_matches = []
+                for item in rows:
+                    if not any("Completed" in segment for segment in item):
+                        continue
+                    item_html_str = " ".join(item)
+
+                    queue_id, download_path = parse_queue_row(item_html_str)
+                    if not download_path or queue_id in processed_ids:
+                        continue
+
+                    if queue_id == expected_id and _claim_queue_id(queue_id):
+                        download_url = urljoin(config["urls"]["login"], download_path)
+                        logger.info(f"Found completed report for {date_range_label} (ID: {queue_id}). URL: {download_url}")
+                        return download_url
+                    if queue_id != expected_id and date_range_label in item_html_str:
+                        label_matches.append((queue_id, download_path))
+                        continue
+
+                    # Completed but for another month (or already claimed); don't look at it again
                     processed_ids.add(queue_id)
 
+                # While the expected report is still listed, wait for it rather than
+                # settling for another report with the same label.
+                if label_matches and expected_id and any(
+                    parse_queue_row(" ".join(item))[0] == expected_id for item in rows
+                ):
+                    label_matches = []
+
+                for queue_id, href in label_matches:
+                    if _claim_queue_id(queue_id):
+                        download_url = urljoin(config["urls"]["login"], href)
+                        logger.info(f"Found completed report for {date_range_label} (ID: {queue_id}). URL: {download_url}")
+                        return download_url
+                    processed_ids.add(queue_id)
+
+            consecutive_errors = 0
+            # Jitter keeps concurrent pollers from hitting the queue in lockstep.
+            sleep_seconds = max(0.0, interval + random.uniform(-jitter, jitter))
+            interval = min(max_interval, interval * growth_factor)
+            if pipeline:
+                sleep_seconds = max(0.0, sleep_seconds - (time.monotonic() - poll_started))
+
         except (requests.exceptions.RequestException, ValueError) as e:
-            logger.warning(f"Could not poll report queue: {e}")
+            consecutive_errors += 1
+            backoff = min(max_backoff, interval * 2 ** consecutive_errors) * random.uniform(0.5, 1.0)
+            sleep_seconds = max(interval, backoff)
+            logger.warning(f"Could not poll report queue ({consecutive_errors} consecutive errors): {e}")
         
-        logger.debug(f"Report not ready. Waiting {polling_config['interval_seconds']} seconds...")
-        time.sleep(polling_config["interval_seconds"])
+        logger.debug(f"Report not ready. Waiting {sleep_seconds:.2f} seconds (current interval {interval:.2f}s)...")
+        time.sleep(sleep_seconds)
 
     logger.error(f"Timeout reached while waiting for report '{date_range_label}'.")
     return None
 
 def download_file(session: requests.Session, url: str, output_dir: str):
-    """Downloads a file from a URL and saves it to the output directory."""
-    os.makedirs(output_dir, exist_ok=True)
+    """Downloads a file from a URL and saves it to the output directory, which must exist."""
+    output_path = None
     try:
-        with fetch(session, url, stream=True, timeout=300) as r:
+        # XLSX files are already compressed; ask for them as-is so no time is spent
+        # decoding and content-length matches the streamed size.
+        with fetch(session, url, stream=True, timeout=300, headers={"Accept-Encoding": "identity"}) as r:
             content_disp = r.headers.get("content-disposition")
-            fname_match = re.search('filename="(.+?)"', content_disp) if content_disp else None
-            fname = fname_match.group(1) if fname_match else url.split("=")[-1] + ".xlsx"
+            fname_match = FILENAME_RE.search(content_disp) if content_disp else None
+            if fname_match:
+                fname = fname_match.group(1)
+            else:
+                queue_id_match = QUEUE_ID_RE.search(url)
+                fname = (queue_id_match.group(1) if queue_id_match else url.split("=")[-1]) + ".xlsx"
             
             output_path = os.path.join(output_dir, fname)
             total_size = int(r.headers.get('content-length', 0))
@@ -200,25 +425,80 @@ def download_file(session: requests.Session, url: str, output_dir: str):
             with open(output_path, "wb") as f, tqdm(
                 desc=fname, total=total_size, unit="iB", unit_scale=True, unit_divisor=1024
             ) as bar:
-                for chunk in r.iter_content(chunk_size=8192):
-                    size = f.write(chunk)
-                    bar.update(size)
+                # Let the raw stream undo any Content-Encoding, then copy in large chunks.
+                r.raw.decode_content = True
+                wrapped = CallbackIOWrapper(bar.update, f, "write")
+                shutil.copyfileobj(r.raw, wrapped, length=DOWNLOAD_CHUNK_SIZE)
             logger.info(f"Successfully downloaded and saved report to {output_path}")
-    except requests.exceptions.RequestException as e:
+    # Reading r.raw directly surfaces urllib3 errors rather than requests' wrappers.
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
         logger.error(f"Failed to download file from {url}: {e}")
+        # Never leave a truncated file behind looking like a finished report.
+        if output_path and os.path.exists(output_path):
+            os.remove(output_path)
+
+def wait_for_rate_limit(rate_limit: float):
+    """Blocks until at least rate_limit seconds have passed since the previous month started."""
+    global _next_month_start
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait_seconds = max(0.0, _next_month_start - now)
+        _next_month_start = max(now, _next_month_start) + rate_limit
+    if wait_seconds:
+        logger.info(f"Waiting for {wait_seconds:.1f} seconds before next request...")
+        time.sleep(wait_seconds)
+
+def process_month(session: requests.Session, config: Dict[str, Any], date_range: Dict[str, str],
+                  download_queue: "queue.Queue[Optional[Tuple[str, str]]]"):
+    """Requests and waits for the report for a single month, then hands it to the downloader."""
+    wait_for_rate_limit(float(config.get("rate_limit_seconds", 5.0)))
+
+    accepted, queue_id, seen_ids = request_report_generation(session, config, date_range)
+    if accepted:
+        download_url = poll_report_queue(
+            session, config, date_range["label"], expected_id=queue_id, seen_ids=seen_ids
+        )
+        if download_url:
+            download_queue.put((date_range["label"], download_url))
+        else:
+            logger.error(f"Could not retrieve download URL for report {date_range['label']}. Skipping.")
+
+def download_worker(session: requests.Session, download_queue: "queue.Queue[Optional[Tuple[str, str]]]", output_dir: str):
+    """Downloads reports from the queue until a None sentinel is received."""
+    while True:
+        item = download_queue.get()
+        if item is None:
+            break
+        label, download_url = item
+        logger.info(f"Downloading report for {label}")
+        try:
+            download_file(session, download_url, output_dir)
+        except Exception as e:
+            logger.error(f"Unexpected error while downloading report for {label}: {e}")
 
 def run_scraper(config_path: str):
     """Main function to orchestrate the scraping process."""
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
     except FileNotFoundError:
         logger.error(f"Configuration file not found at {config_path}")
         return
     
-    with requests.Session() as session:
-        session.headers.update({"User-Agent": config.get("user_agent", "ESB-Scraper/1.0")})
+    polling_config = config["polling_settings"]
+    if "interval_seconds" in polling_config:
+        logger.warning("polling_settings.interval_seconds is deprecated; use min_interval_seconds "
+                       "and max_interval_seconds instead.")
+        # Keep honouring the old fixed interval as the ceiling of the adaptive schedule.
+        polling_config.setdefault("max_interval_seconds", polling_config["interval_seconds"])
+
+    output_dir = config["output"]["directory"]
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Polling is dominated by idle waits, so keep several months in flight at once.
+    concurrency = max(1, int(config.get("concurrency", 1)))
 
+    with create_session(config, concurrency) as session:
         if not login(session, config):
             logger.error("Stopping scraper due to login failure.")
             return
@@ -229,18 +509,43 @@ def run_scraper(config_path: str):
             scraping_params["end_date"]
         )
         
-        rate_limit = float(config.get("rate_limit_seconds", 5.0))
-        
-        for date_range in date_ranges:
-            if request_report_generation(session, config, date_range):
-                download_url = poll_report_queue(session, config, date_range["label"])
-                if download_url:
-                    download_file(session, download_url, config["output"]["directory"])
-                else:
-                    logger.error(f"Could not retrieve download URL for report {date_range['label']}. Skipping.")
-            
-            logger.info(f"Waiting for {rate_limit} seconds before next request...")
-            time.sleep(rate_limit)
+        logger.info(f"Processing months with concurrency {concurrency}")
+
+        # Downloads run on their own thread and session so a large file for one month
+        # overlaps with polling for the next instead of holding up a polling slot.
+        download_queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(maxsize=concurrency)
+
+        with ThreadPoolExecutor(max_workers=1) as downloader:
+            download_future = downloader.submit(
+                download_worker, clone_session(session), download_queue, output_dir
+            )
+
+            try:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor, tqdm(
+                    desc="Months", total=len(date_ranges), unit="month"
+                ) as months_bar:
+                    # Clones are made here on the main thread, so the login session is
+                    # never touched by the workers.
+                    futures = [
+                        executor.submit(process_month, clone_session(session), config, dr, download_queue)
+                        for dr in date_ranges
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            try:
+                                future.result()
+                            except Exception as e:
+                                logger.error(f"Unexpected error while processing a month: {e}")
+                            months_bar.update(1)
+                    except BaseException:
+                        # On Ctrl-C (or any other escape) drop the months that haven't started yet
+                        # instead of letting each of them poll until its timeout.
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+            finally:
+                # Always release the downloader, or the executor below waits on it forever.
+                download_queue.put(None)
+            download_future.result()
 
     logger.info("Scraping process finished.")
 
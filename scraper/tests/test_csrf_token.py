@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is on sys.path so tests can import the module
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from scrape_esb import get_csrf_token
+
+
+def test_get_csrf_token_regex_match():
+    html = '<html><head><meta name="csrf-token" content="abc123=="></head></html>'
+    assert get_csrf_token(html) == "abc123=="
+
+
+def test_get_csrf_token_reversed_attributes():
+    html = '<html><head><meta content="xyz789" name="csrf-token"></head></html>'
+    assert get_csrf_token(html) == "xyz789"
+
+
+def test_get_csrf_token_missing():
+    assert get_csrf_token("<html><head><title>Login</title></head></html>") is None
+
+
+def test_get_csrf_token_unparseable_documents():
+    assert get_csrf_token("") is None
+    assert get_csrf_token("<!-- nothing here -->") is None
+    xhtml = '<?xml version="1.0" encoding="UTF-8"?><html><head></head></html>'
+    assert get_csrf_token(xhtml) is None
@@ -0,0 +1,40 @@
+import socket
+import sys
+import threading
+from pathlib import Path
+
+# Ensure project root is on sys.path so tests can import the module
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+import requests
+
+from scrape_esb import download_file
+
+
+def _serve_truncated_response(server: socket.socket):
+    conn, _ = server.accept()
+    with conn:
+        conn.recv(65536)
+        conn.sendall(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Length: 100000\r\n"
+            b'Content-Disposition: attachment; filename="r.xlsx"\r\n'
+            b"\r\n" + b"x" * 1000
+        )
+
+
+def test_download_file_removes_truncated_file(tmp_path):
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+    thread = threading.Thread(target=_serve_truncated_response, args=(server,))
+    thread.start()
+    try:
+        with requests.Session() as session:
+            download_file(session, f"http://127.0.0.1:{port}/site/download-queue?id=1", str(tmp_path))
+    finally:
+        thread.join()
+        server.close()
+    assert not (tmp_path / "r.xlsx").exists()
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is on sys.path so tests can import the module
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from scrape_esb import generate_monthly_ranges
+
+
+def test_generate_monthly_ranges_full_months():
+    ranges = generate_monthly_ranges("2023-12-01", "2024-02-29")
+    assert ranges == [
+        {"start": "01-12-2023", "end": "31-12-2023", "label": "2023-12"},
+        {"start": "01-01-2024", "end": "31-01-2024", "label": "2024-01"},
+        {"start": "01-02-2024", "end": "29-02-2024", "label": "2024-02"},
+    ]
+
+
+def test_generate_monthly_ranges_clamps_to_end_date():
+    ranges = generate_monthly_ranges("2024-01-15", "2024-02-10")
+    assert ranges == [
+        {"start": "15-01-2024", "end": "31-01-2024", "label": "2024-01"},
+        {"start": "01-02-2024", "end": "10-02-2024", "label": "2024-02"},
+    ]
@@ -0,0 +1,115 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is on sys.path so tests can import the module
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+import scrape_esb
+from scrape_esb import poll_report_queue
+
+CONFIG = {
+    "urls": {"login": "https://esb.example/site/login"},
+    "polling_settings": {"timeout_seconds": 60, "min_interval_seconds": 0, "jitter_seconds": 0},
+}
+
+
+class StubResponse:
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        if self._data is None:
+            raise ValueError("No JSON body")
+        return self._data
+
+
+class StubSession:
+    """Returns queued responses and records the headers of every request."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def completed_row(queue_id, label):
+    return [f"Sales {label}", "Completed", f'<a href="/site/download-queue?id={queue_id}">Download</a>']
+
+
+@pytest.fixture(autouse=True)
+def no_sleep_and_fresh_claims(monkeypatch):
+    monkeypatch.setattr(scrape_esb.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(scrape_esb, "_claimed_queue_ids", set())
+
+
+def test_poll_skips_304_and_matches_later_200():
+    session = StubSession([
+        StubResponse(data={"data": [["Sales 2024-01", "Pending", ""]]}, headers={"ETag": '"v1"'}),
+        StubResponse(status_code=304),
+        StubResponse(data={"data": [completed_row(7, "2024-01")]}, headers={"ETag": '"v2"'}),
+    ])
+    url = poll_report_queue(session, CONFIG, "2024-01")
+    assert url == "https://esb.example/site/download-queue?id=7"
+    assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+
+
+def test_poll_does_not_keep_validators_of_unparseable_body():
+    session = StubSession([
+        StubResponse(data=None, headers={"ETag": '"bad"'}),
+        StubResponse(data={"data": [completed_row(7, "2024-01")]}),
+    ])
+    assert poll_report_queue(session, CONFIG, "2024-01") is not None
+    assert session.sent_headers[1] == {}
+
+
+def test_poll_skips_claimed_ids(monkeypatch):
+    monkeypatch.setattr(scrape_esb, "_claimed_queue_ids", {"7"})
+    session = StubSession([
+        StubResponse(data={"data": [completed_row(7, "2024-01")]}),
+        StubResponse(data={"data": [completed_row(7, "2024-01"), completed_row(8, "2024-01")]}),
+    ])
+    url = poll_report_queue(session, CONFIG, "2024-01")
+    assert url == "https://esb.example/site/download-queue?id=8"
+    assert scrape_esb._claimed_queue_ids == {"7", "8"}
+
+
+def pending_row(queue_id, label):
+    return [f"Sales {label}", "Pending", f'<a href="/site/delete-queue?id={queue_id}">Cancel</a>']
+
+
+def test_poll_waits_for_expected_id_while_it_is_listed():
+    session = StubSession([
+        StubResponse(data={"data": [completed_row(5, "2024-01"), pending_row(6, "2024-01")]}),
+        StubResponse(data={"data": [completed_row(5, "2024-01"), completed_row(6, "2024-01")]}),
+    ])
+    url = poll_report_queue(session, CONFIG, "2024-01", expected_id="6")
+    assert url == "https://esb.example/site/download-queue?id=6"
+    assert scrape_esb._claimed_queue_ids == {"6"}
+
+
+def test_poll_falls_back_to_label_when_expected_id_is_missing():
+    session = StubSession([
+        StubResponse(data={"data": [completed_row(7, "2024-01")]}),
+    ])
+    url = poll_report_queue(session, CONFIG, "2024-01", expected_id="99")
+    assert url == "https://esb.example/site/download-queue?id=7"
+
+
+def test_poll_never_picks_seen_ids():
+    session = StubSession([
+        StubResponse(data={"data": [completed_row(5, "2024-01")]}),
+        StubResponse(data={"data": [completed_row(5, "2024-01"), completed_row(8, "2024-01")]}),
+    ])
+    url = poll_report_queue(session, CONFIG, "2024-01", seen_ids={"5"})
+    assert url == "https://esb.example/site/download-queue?id=8"
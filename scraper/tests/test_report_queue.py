@@ -0,0 +1,41 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is on sys.path so tests can import the module
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from scrape_esb import parse_generation_response, parse_queue_row
+
+GENERATION_RESPONSE_HTML = """
+<table>
+  <tr><td>Sales 2024-01</td><td>Completed</td><td><a href="/site/download-queue?id=9">Download</a></td></tr>
+  <tr><td>Sales 2024-01</td><td>Pending</td><td><a href="/site/delete-queue?id=11">Cancel</a></td></tr>
+  <tr><td>Sales 2024-01</td><td>Pending</td><td><a href="/site/delete-queue?id=13">Cancel</a></td></tr>
+  <tr><td>Sales 2024-02</td><td>Pending</td><td><a href="/site/delete-queue?id=14">Cancel</a></td></tr>
+</table>
+"""
+
+
+def test_parse_queue_row_completed():
+    row = 'Sales 2024-01 Completed <a href="/site/download-queue?id=9">Download</a>'
+    assert parse_queue_row(row) == ("9", "/site/download-queue?id=9")
+
+
+def test_parse_queue_row_pending():
+    row = 'Sales 2024-01 Pending <a href="/site/delete-queue?id=11">Cancel</a>'
+    assert parse_queue_row(row) == ("11", None)
+    assert parse_queue_row("Sales 2024-01 Pending") == (None, None)
+
+
+def test_parse_generation_response_picks_newest_pending_report():
+    expected_id, seen_ids = parse_generation_response(GENERATION_RESPONSE_HTML, "2024-01")
+    assert expected_id == "13"
+    assert seen_ids == {"9", "11"}
+
+
+def test_parse_generation_response_without_pending_report():
+    expected_id, seen_ids = parse_generation_response(GENERATION_RESPONSE_HTML, "2023-12")
+    assert (expected_id, seen_ids) == (None, set())
+    expected_id, seen_ids = parse_generation_response("<html><body>Report queued</body></html>", "2024-01")
+    assert (expected_id, seen_ids) == (None, set())